@@ -0,0 +1,8 @@
+"""Shared pytest configuration for the backend test suite."""
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "integration: tests that hit the real network; skipped unless RUN_INTEGRATION=1"
+    )
@@ -6,14 +6,273 @@ using the A2S (Source Engine query) protocol. It handles connection management,
 error handling, timeout management, and hostname resolution.
 """
 
+import asyncio
+import atexit
+import functools
+import selectors
 import socket
+import struct
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, Optional, List, Tuple
 import a2s
 
+# a2s's public helpers open and close a fresh UDP socket on every call. Its
+# internal stream API lets a fetcher keep one socket per server address and
+# reuse it across queries, skipping the per-call socket churn for repeated
+# polls. Fall back to the public helpers if these internals ever move.
+try:
+    from a2s.a2s_sync import A2SStream, request_sync_impl
+    from a2s.a2s_async import A2SStreamAsync, request_async_impl
+    from a2s.info import InfoProtocol
+    from a2s.players import PlayersProtocol
+    _HAS_STREAM_API = True
+except ImportError:  # pragma: no cover - depends on a2s internals
+    _HAS_STREAM_API = False
+
 logger = logging.getLogger(__name__)
 
+# Raw A2S_INFO probe for the single-socket fan-out path: the simple-packet
+# header followed by "TSource Engine Query\0". Servers that demand proof of
+# reachability answer with a challenge packet (type 0x41) carrying four
+# bytes that must be appended to a resent probe.
+_A2S_SIMPLE_HEADER = b"\xff\xff\xff\xff"
+_A2S_INFO_REQUEST = _A2S_SIMPLE_HEADER + b"TSource Engine Query\x00"
+_A2S_CHALLENGE_RESPONSE = 0x41
+_A2S_INFO_RESPONSE = 0x49         # Source reply layout
+_A2S_INFO_RESPONSE_LEGACY = 0x6D  # GoldSrc reply layout
+
+# Fixed-layout slices of the A2S_INFO reply formats, compiled once so batch
+# parsing skips per-call format-string parsing. Variable-length string
+# fields are scanned with bytes.index for their null terminators instead.
+_INFO_HEADER = struct.Struct("<iB")              # packet marker + response type
+_INFO_SOURCE_FIXED = struct.Struct("<HBBBccBB")  # app_id through the VAC flag
+_INFO_GOLDSRC_FIXED = struct.Struct("<BBBccBB")  # player count through the mod flag
+
+
+def _read_cstring(data: bytes, offset: int) -> Tuple[str, int]:
+    """Decode a null-terminated string, returning (text, offset past the NUL)."""
+    end = data.index(b"\0", offset)
+    return data[offset:end].decode("utf-8", errors="replace"), end + 1
+
+
+def _parse_info_fields(data: bytes) -> Dict[str, Any]:
+    """
+    Decode the info fields of a raw single-packet A2S_INFO reply.
+
+    Understands both the Source layout (0x49) and the GoldSrc legacy layout
+    (0x6D) that CS 1.6 servers still emit. Raises ValueError for any other
+    response type; struct.error propagates for truncated payloads.
+    """
+    response_type = _INFO_HEADER.unpack_from(data, 0)[1]
+    offset = _INFO_HEADER.size
+    if response_type == _A2S_INFO_RESPONSE:
+        offset += 1  # protocol version byte
+        server_name, offset = _read_cstring(data, offset)
+        map_name, offset = _read_cstring(data, offset)
+        _folder, offset = _read_cstring(data, offset)
+        game, offset = _read_cstring(data, offset)
+        (_app_id, player_count, max_players, _bots,
+         server_type, platform, password, vac) = _INFO_SOURCE_FIXED.unpack_from(data, offset)
+        server_type = server_type.decode("ascii", errors="replace").lower()
+        platform = platform.decode("ascii", errors="replace").lower()
+        if platform == "o":  # deprecated mac value
+            platform = "m"
+    elif response_type == _A2S_INFO_RESPONSE_LEGACY:
+        _address, offset = _read_cstring(data, offset)
+        server_name, offset = _read_cstring(data, offset)
+        map_name, offset = _read_cstring(data, offset)
+        _folder, offset = _read_cstring(data, offset)
+        game, offset = _read_cstring(data, offset)
+        (player_count, max_players, _protocol,
+         server_type, platform, password, is_mod) = _INFO_GOLDSRC_FIXED.unpack_from(data, offset)
+        offset += _INFO_GOLDSRC_FIXED.size
+        # Some games omit the mod section despite setting the flag
+        if is_mod and len(data) - offset > 2:
+            _mod_website, offset = _read_cstring(data, offset)
+            _mod_download, offset = _read_cstring(data, offset)
+            offset += 11  # NUL byte, mod version and size, two flag bytes
+        vac = data[offset]
+        server_type = server_type.decode("ascii", errors="replace")
+        platform = platform.decode("ascii", errors="replace")
+    else:
+        raise ValueError(f"Unexpected response type: 0x{response_type:02x}")
+
+    return {
+        "hostname": server_name,
+        "map": map_name,
+        "current_players": player_count,
+        "max_players": max_players,
+        "game": game,
+        "server_type": server_type,
+        "os": platform,
+        "password_protected": bool(password),
+        "vac_enabled": bool(vac),
+    }
+
+# Process-wide DNS cache: hostname -> (resolved_ip, expiry timestamp).
+# Repeat queries to the same host (e.g. a widget polling every 30s) hit
+# memory instead of paying a blocking resolver round trip every time.
+DNS_CACHE_TTL = 300.0
+# Failed lookups are remembered briefly too, so a widget pointed at a dead
+# hostname fails fast on every poll instead of re-running a doomed resolver
+# round trip each time
+DNS_NEGATIVE_TTL = 30.0
+_dns_cache: Dict[str, Tuple[str, float]] = {}
+_dns_negative_cache: Dict[str, float] = {}
+_dns_cache_lock = threading.Lock()
+
+# Shared pool for the player-list query so it can overlap the info query.
+# Threads are created lazily, so idle capacity costs nothing.
+_player_query_pool = ThreadPoolExecutor(max_workers=64, thread_name_prefix="a2s-players")
+
+
+def is_ip_literal(host: str) -> bool:
+    """Check whether host is already a numeric IPv4/IPv6 address."""
+    # Cheap shape checks first so ordinary hostnames skip the parse
+    # attempts entirely: dotted quads have exactly three dots, and IPv6
+    # literals always contain a colon
+    if host.count(".") == 3:
+        try:
+            socket.inet_pton(socket.AF_INET, host)
+            return True
+        except OSError:
+            pass
+    if ":" in host:
+        try:
+            socket.inet_pton(socket.AF_INET6, host)
+            return True
+        except OSError:
+            pass
+    return False
+
+
+def dns_cache_lookup(host: str) -> Optional[str]:
+    """Return the cached IP for a hostname, or None if absent/expired."""
+    with _dns_cache_lock:
+        cached = _dns_cache.get(host)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+    return None
+
+
+def dns_cache_store(host: str, ip: str, ttl: float = DNS_CACHE_TTL) -> None:
+    """Store a resolved IP for a hostname with the given TTL."""
+    with _dns_cache_lock:
+        _dns_cache[host] = (ip, time.monotonic() + ttl)
+
+
+def dns_cache_store_failure(host: str, ttl: float = DNS_NEGATIVE_TTL) -> None:
+    """Record a failed lookup so repeat queries fail fast for `ttl` seconds."""
+    with _dns_cache_lock:
+        _dns_negative_cache[host] = time.monotonic() + ttl
+
+
+def dns_cache_has_failure(host: str) -> bool:
+    """Check whether a recent lookup for this hostname failed."""
+    with _dns_cache_lock:
+        expiry = _dns_negative_cache.get(host)
+        return expiry is not None and expiry > time.monotonic()
+
+
+def _resolve_host_cached(host: str, ttl: float = DNS_CACHE_TTL) -> str:
+    """
+    Resolve a hostname to an IP, caching results for `ttl` seconds.
+
+    IP literals are returned as-is without touching the resolver.
+
+    Raises:
+        socket.gaierror: If the hostname cannot be resolved
+    """
+    if is_ip_literal(host):
+        return host
+
+    cached = dns_cache_lookup(host)
+    if cached is not None:
+        return cached
+
+    # AI_NUMERICHOST makes getaddrinfo a pure string parse - no nsswitch,
+    # hosts file or DNS traffic - and catches numeric forms the cheap
+    # literal check rejects (e.g. shorthand dotted quads like "127.1")
+    try:
+        infos = socket.getaddrinfo(host, None, type=socket.SOCK_DGRAM,
+                                   flags=socket.AI_NUMERICHOST)
+        return infos[0][4][0]
+    except socket.gaierror:
+        pass
+
+    # Fail fast on hostnames that recently failed to resolve rather than
+    # blocking on another doomed lookup
+    if dns_cache_has_failure(host):
+        raise socket.gaierror(f"resolution recently failed for '{host}'")
+
+    # getaddrinfo rather than gethostbyname: same blocking lookup on a
+    # miss, but IPv6-capable and consistent with the async resolve path
+    try:
+        infos = socket.getaddrinfo(host, None, type=socket.SOCK_DGRAM)
+    except socket.gaierror:
+        dns_cache_store_failure(host)
+        raise
+    resolved_ip = infos[0][4][0]
+    dns_cache_store(host, resolved_ip, ttl)
+    return resolved_ip
+
+
+class QueryResult:
+    """
+    Outcome of a single server query.
+
+    A fixed-slot container instead of a dict: batch fetches produce one of
+    these per server, and slot storage is several times smaller than a
+    hash table per result, with attribute access at a fixed offset.
+    Subscription and membership tests are kept so existing dict-style
+    consumers (result["success"], "error" in result) work unchanged, and
+    they mirror the original dict shape: "data" is only present on
+    success and "error" only on failure. as_dict() rebuilds the plain
+    mapping for JSON boundaries.
+    """
+
+    __slots__ = ("success", "data", "error")
+
+    def __init__(self, success: bool, data: Optional[Dict[str, Any]] = None,
+                 error: Optional[str] = None):
+        self.success = success
+        self.data = data
+        self.error = error
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        if key == "success":
+            return True
+        if key == "data":
+            return self.success
+        if key == "error":
+            return not self.success
+        return False
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get over the fields present for this outcome."""
+        if key in self:
+            return getattr(self, key)
+        return default
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Rebuild the plain response dictionary for serialization."""
+        if self.success:
+            return {"success": True, "data": self.data}
+        return {"success": False, "error": self.error}
+
+    def __repr__(self) -> str:
+        if self.success:
+            return f"QueryResult(success=True, data={self.data!r})"
+        return f"QueryResult(success=False, error={self.error!r})"
+
 
 class CS16ServerFetcher:
     """
@@ -26,15 +285,129 @@ class CS16ServerFetcher:
     DEFAULT_TIMEOUT = 3.0
     MIN_PORT = 1
     MAX_PORT = 65535
-    
+    STREAM_IDLE_TIMEOUT = 60.0
+
     def __init__(self, timeout: float = DEFAULT_TIMEOUT):
         """
         Initialize the server fetcher.
-        
+
         Args:
             timeout: Connection timeout in seconds (default: 3.0)
         """
         self.timeout = max(timeout, 0.5)  # Ensure minimum timeout
+        # Idle UDP streams kept per server address for reuse across queries
+        self._streams: Dict[Tuple[str, int], List] = {}
+        self._streams_lock = threading.Lock()
+        self._async_streams: Dict[Tuple[str, int], List] = {}
+        # Batch executor, created lazily on the first fetch_multiple call
+        # and reused so repeated batches amortize thread creation
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # Drain pooled sockets on interpreter shutdown
+        atexit.register(self.close)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the shared batch executor."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_CONCURRENT_QUERIES,
+                    thread_name_prefix="a2s-fetch"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the batch executor and close any pooled idle streams."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        with self._streams_lock:
+            for pool in self._streams.values():
+                for stream, _ in pool:
+                    stream.close()
+            self._streams.clear()
+        for pool in self._async_streams.values():
+            for stream, _ in pool:
+                try:
+                    stream.close()
+                except (OSError, RuntimeError):
+                    # At interpreter exit the owning event loop is often
+                    # already closed and transport.close() raises; the
+                    # socket dies with the process either way
+                    pass
+        self._async_streams.clear()
+
+    def _checkout_stream(self, address: Tuple[str, int]):
+        """Take an idle stream for the address, or open a fresh one."""
+        now = time.monotonic()
+        with self._streams_lock:
+            pool = self._streams.get(address)
+            while pool:
+                stream, last_used = pool.pop()
+                if now - last_used < self.STREAM_IDLE_TIMEOUT:
+                    return stream
+                stream.close()
+        return A2SStream(address, self.timeout)
+
+    def _checkin_stream(self, address: Tuple[str, int], stream) -> None:
+        """Return a healthy stream to the pool for later reuse."""
+        with self._streams_lock:
+            self._streams.setdefault(address, []).append((stream, time.monotonic()))
+
+    def _request_stream(self, address: Tuple[str, int], protocol):
+        """Run one A2S exchange over a pooled stream."""
+        stream = self._checkout_stream(address)
+        try:
+            response = request_sync_impl(stream, "utf-8", protocol)
+        except Exception:
+            # A failed exchange may leave stale packets on the socket
+            stream.close()
+            raise
+        self._checkin_stream(address, stream)
+        return response
+
+    async def _checkout_stream_async(self, address: Tuple[str, int]):
+        """Async variant of _checkout_stream (event-loop only, no lock)."""
+        now = time.monotonic()
+        pool = self._async_streams.get(address)
+        while pool:
+            stream, last_used = pool.pop()
+            if now - last_used < self.STREAM_IDLE_TIMEOUT:
+                return stream
+            stream.close()
+        return await A2SStreamAsync.create(address, self.timeout)
+
+    async def _request_stream_async(self, address: Tuple[str, int], protocol):
+        """Async variant of _request_stream."""
+        stream = await self._checkout_stream_async(address)
+        try:
+            response = await request_async_impl(stream, "utf-8", protocol)
+        except Exception:
+            stream.close()
+            raise
+        self._async_streams.setdefault(address, []).append((stream, time.monotonic()))
+        return response
+
+    def _query_info(self, address: Tuple[str, int]):
+        if _HAS_STREAM_API:
+            return self._request_stream(address, InfoProtocol)
+        return a2s.info(address, timeout=self.timeout)
+
+    def _query_players(self, address: Tuple[str, int]):
+        if _HAS_STREAM_API:
+            return self._request_stream(address, PlayersProtocol)
+        return a2s.players(address, timeout=self.timeout)
+
+    async def _query_info_async(self, address: Tuple[str, int]):
+        if _HAS_STREAM_API:
+            return await self._request_stream_async(address, InfoProtocol)
+        return await a2s.ainfo(address, timeout=self.timeout)
+
+    async def _query_players_async(self, address: Tuple[str, int]):
+        if _HAS_STREAM_API:
+            return await self._request_stream_async(address, PlayersProtocol)
+        return await a2s.aplayers(address, timeout=self.timeout)
     
     def resolve_address(self, host: str, port: int) -> Tuple[str, int]:
         """
@@ -50,25 +423,41 @@ class CS16ServerFetcher:
         Raises:
             ValueError: If port is invalid or host cannot be resolved
         """
-        if not isinstance(port, int):
-            raise ValueError(f"Port must be an integer, got {type(port)}")
-        
-        if port < self.MIN_PORT or port > self.MAX_PORT:
-            raise ValueError(f"Port must be between {self.MIN_PORT} and {self.MAX_PORT}, got {port}")
-        
+        error = self._validate_address(host, port)
+        if error is not None:
+            raise ValueError(error)
+
+        resolved_ip, error = self._resolve_checked(host)
+        if error is not None:
+            raise ValueError(error)
+        return resolved_ip, port
+
+    def _validate_address(self, host: str, port: int) -> Optional[str]:
+        """Return an error message for invalid input, or None if valid."""
+        # bool is an int subclass, and True would otherwise pass as port 1
+        if not isinstance(port, int) or isinstance(port, bool):
+            return f"Port must be an integer, got {type(port)}"
+
+        if not self.MIN_PORT <= port <= self.MAX_PORT:
+            return f"Port must be between {self.MIN_PORT} and {self.MAX_PORT}, got {port}"
+
         if not host or not isinstance(host, str):
-            raise ValueError("Host must be a non-empty string")
-        
+            return "Host must be a non-empty string"
+
+        return None
+
+    @staticmethod
+    def _resolve_checked(host: str) -> Tuple[Optional[str], Optional[str]]:
+        """Resolve a hostname, returning (ip, None) or (None, error message)."""
         try:
-            # Try to resolve hostname to IP
-            resolved_ip = socket.gethostbyname(host)
-            return resolved_ip, port
+            # Cached; skips DNS entirely for IP literals
+            return _resolve_host_cached(host), None
         except socket.gaierror as e:
-            raise ValueError(f"Cannot resolve hostname '{host}': {str(e)}")
+            return None, f"Cannot resolve hostname '{host}': {str(e)}"
         except Exception as e:
-            raise ValueError(f"Address resolution error: {str(e)}")
+            return None, f"Address resolution error: {str(e)}"
     
-    def fetch(self, host: str, port: int) -> Dict[str, Any]:
+    def fetch(self, host: str, port: int) -> QueryResult:
         """
         Fetch server information from a CS 1.6 server.
         
@@ -77,129 +466,387 @@ class CS16ServerFetcher:
             port: Server port
             
         Returns:
-            Dictionary with server information:
+            QueryResult whose data (on success) holds:
             {
-                "success": bool,
-                "data": {
-                    "hostname": str,
-                    "map": str,
-                    "current_players": int,
-                    "max_players": int,
-                    "game": str,
-                    "server_type": str,
-                    "os": str,
-                    "password_protected": bool,
-                    "vac_enabled": bool,
-                    "ping": float,
-                    "player_list": list
-                },
-                "error": str (if not successful)
+                "hostname": str,
+                "map": str,
+                "current_players": int,
+                "max_players": int,
+                "game": str,
+                "server_type": str,
+                "os": str,
+                "password_protected": bool,
+                "vac_enabled": bool,
+                "ping": float,
+                "player_list": dict with "names", "scores", "durations" lists
             }
+            and whose error is set when success is False. The result also
+            supports dict-style subscription for these fields.
         """
+        # Invalid input and dead hostnames are common on batch workloads,
+        # so handle them with explicit checks instead of exception dispatch
+        error = self._validate_address(host, port)
+        if error is None:
+            resolved_ip, error = self._resolve_checked(host)
+        if error is not None:
+            logger.warning("Invalid input for %s:%s - %s", host, port, error)
+            return QueryResult(False, error=error)
+        address = (resolved_ip, port)
+
         try:
-            # Resolve address
-            resolved_ip, resolved_port = self.resolve_address(host, port)
-            address = (resolved_ip, resolved_port)
-            
-            # Measure and fetch server info
+            # Fetch server info and player list concurrently - they are
+            # independent UDP exchanges, so there is no need to serialize them
+            player_future = _player_query_pool.submit(self._fetch_player_list, address)
+
             start_time = time.time()
-            info = a2s.info(address, timeout=self.timeout)
+            info = self._query_info(address)
             ping = (time.time() - start_time) * 1000
-            
-            # Fetch player list
-            player_list = self._fetch_player_list(address)
-            
-            return {
-                "success": True,
-                "data": {
-                    "hostname": info.server_name,
-                    "map": info.map_name,
-                    "current_players": info.player_count,
-                    "max_players": info.max_players,
-                    "game": info.game,
-                    "server_type": info.server_type,
-                    "os": info.platform,
-                    "password_protected": info.password_protected,
-                    "vac_enabled": info.vac_enabled,
-                    "ping": round(ping, 2),
-                    "player_list": player_list
-                }
-            }
-            
-        except ValueError as e:
-            logger.warning(f"Invalid input for {host}:{port} - {str(e)}")
-            return {"success": False, "error": str(e)}
+
+            player_list = player_future.result()
+
+            return self._format_result(info, ping, player_list)
+
         except socket.timeout:
-            logger.warning(f"Connection timeout for {host}:{port}")
-            return {"success": False, "error": "Connection timeout - server may be offline"}
+            logger.warning("Connection timeout for %s:%s", host, port)
+            return QueryResult(False, error="Connection timeout - server may be offline")
         except ConnectionRefusedError:
-            logger.warning(f"Connection refused for {host}:{port}")
-            return {"success": False, "error": "Connection refused - invalid IP or port"}
+            logger.warning("Connection refused for %s:%s", host, port)
+            return QueryResult(False, error="Connection refused - invalid IP or port")
         except ConnectionResetError:
-            logger.warning(f"Connection reset for {host}:{port}")
-            return {"success": False, "error": "Connection reset - server may be offline"}
+            logger.warning("Connection reset for %s:%s", host, port)
+            return QueryResult(False, error="Connection reset - server may be offline")
         except socket.error as e:
-            logger.warning(f"Socket error for {host}:{port} - {str(e)}")
-            return {"success": False, "error": f"Network error: {str(e)}"}
+            logger.warning("Socket error for %s:%s - %s", host, port, e)
+            return QueryResult(False, error=f"Network error: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error querying {host}:{port} - {str(e)}")
-            return {"success": False, "error": f"Failed to query server: {str(e)}"}
+            return QueryResult(False, error=f"Failed to query server: {str(e)}")
     
-    def _fetch_player_list(self, address: Tuple[str, int]) -> List[Dict[str, Any]]:
+    async def fetch_async(self, host: str, port: int) -> QueryResult:
+        """
+        Async variant of fetch using a2s's native asyncio API.
+
+        Runs entirely on the event loop without consuming a worker thread,
+        so many queries can be in flight concurrently. Returns the same
+        response structure as fetch.
+        """
+        # Invalid input and dead hostnames are common on batch workloads,
+        # so handle them with explicit checks instead of exception dispatch
+        error = self._validate_address(host, port)
+        if error is None:
+            resolved_ip, error = self._resolve_checked(host)
+        if error is not None:
+            logger.warning("Invalid input for %s:%s - %s", host, port, error)
+            return QueryResult(False, error=error)
+        address = (resolved_ip, port)
+
+        try:
+            # Fetch server info and player list concurrently - they are
+            # independent UDP exchanges, so there is no need to serialize them
+            start_time = time.time()
+            info, player_list = await asyncio.gather(
+                self._query_info_async(address),
+                self._fetch_player_list_async(address)
+            )
+            ping = (time.time() - start_time) * 1000
+
+            return self._format_result(info, ping, player_list)
+
+        except (socket.timeout, asyncio.TimeoutError):
+            logger.warning("Connection timeout for %s:%s", host, port)
+            return QueryResult(False, error="Connection timeout - server may be offline")
+        except ConnectionRefusedError:
+            logger.warning("Connection refused for %s:%s", host, port)
+            return QueryResult(False, error="Connection refused - invalid IP or port")
+        except ConnectionResetError:
+            logger.warning("Connection reset for %s:%s", host, port)
+            return QueryResult(False, error="Connection reset - server may be offline")
+        except socket.error as e:
+            logger.warning("Socket error for %s:%s - %s", host, port, e)
+            return QueryResult(False, error=f"Network error: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error querying {host}:{port} - {str(e)}")
+            return QueryResult(False, error=f"Failed to query server: {str(e)}")
+
+    @staticmethod
+    def _format_result(info: Any, ping: float, player_list: Dict[str, List[Any]]) -> "QueryResult":
+        """Build the success result from an a2s info reply."""
+        return QueryResult(True, data={
+            "hostname": info.server_name,
+            "map": info.map_name,
+            "current_players": info.player_count,
+            "max_players": info.max_players,
+            "game": info.game,
+            "server_type": info.server_type,
+            "os": info.platform,
+            "password_protected": info.password_protected,
+            "vac_enabled": info.vac_enabled,
+            "ping": round(ping, 2),
+            "player_list": player_list
+        })
+
+    def _fetch_player_list(self, address: Tuple[str, int]) -> Dict[str, List[Any]]:
         """
         Fetch the list of players from the server.
-        
+
         Args:
             address: Tuple of (ip, port)
-            
+
         Returns:
-            List of player dictionaries with name, score, and duration
+            Structure-of-arrays dictionary with parallel "names", "scores"
+            and "durations" lists, one entry per named player. Three flat
+            homogeneous lists allocate far less than a dict per player and
+            serialize on the fast path.
         """
         try:
-            players = a2s.players(address, timeout=self.timeout)
-            return [
-                {
-                    "name": p.name,
-                    "score": p.score,
-                    "duration": p.duration
-                }
-                for p in players if p.name
-            ]
+            players = self._query_players(address)
         except Exception as e:
             logger.debug(f"Could not fetch player list from {address}: {str(e)}")
-            return []
-    
-    def fetch_multiple(self, servers: List[Tuple[str, int]]) -> Dict[str, Dict[str, Any]]:
+            players = []
+        return self._format_player_list(players)
+
+    async def _fetch_player_list_async(self, address: Tuple[str, int]) -> Dict[str, List[Any]]:
+        """Async variant of _fetch_player_list."""
+        try:
+            players = await self._query_players_async(address)
+        except Exception as e:
+            logger.debug(f"Could not fetch player list from {address}: {str(e)}")
+            players = []
+        return self._format_player_list(players)
+
+    @staticmethod
+    def _format_player_list(players: List[Any]) -> Dict[str, List[Any]]:
+        """Build the structure-of-arrays player payload from a2s players."""
+        named = [p for p in players if p.name]
+        return {
+            "names": [p.name for p in named],
+            "scores": [p.score for p in named],
+            "durations": [p.duration for p in named]
+        }
+
+    MAX_CONCURRENT_QUERIES = 64
+
+    def fetch_multiple(self, servers: List[Tuple[str, int]]) -> Dict[str, QueryResult]:
         """
-        Fetch information from multiple servers.
-        
+        Fetch information from multiple servers concurrently.
+
+        Each query is network-bound and independent, so they are dispatched
+        to a thread pool instead of running back-to-back. Total wall time is
+        roughly one timeout regardless of how many servers are offline.
+
         Args:
             servers: List of (host, port) tuples
-            
+
         Returns:
-            Dictionary mapping "host:port" to server info dictionaries
+            Dictionary mapping "host:port" to QueryResult objects
         """
+        if not servers:
+            return {}
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop running: a throwaway event loop drives the whole batch
+            # from this thread with no worker-thread dispatch at all
+            return asyncio.run(self._fetch_multiple_on_loop(servers))
+
+        # This thread is already running an event loop (a sync call made
+        # from event-loop context), so asyncio.run would raise; fall back
+        # to the thread-pool fan-out
+        return self._fetch_multiple_threaded(servers)
+
+    async def _fetch_multiple_on_loop(self, servers: List[Tuple[str, int]]) -> Dict[str, QueryResult]:
+        """Run a batch on a private event loop, then drop its streams."""
+        try:
+            return await self.fetch_multiple_async(servers)
+        finally:
+            # Pooled async streams are bound to this short-lived loop and
+            # cannot be reused once it closes
+            for pool in self._async_streams.values():
+                for stream, _ in pool:
+                    stream.close()
+            self._async_streams.clear()
+
+    def _fetch_multiple_threaded(self, servers: List[Tuple[str, int]]) -> Dict[str, QueryResult]:
+        """Thread-pool fallback for fetch_multiple."""
         results = {}
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self.fetch, host, port): f"{host}:{port}"
+            for host, port in servers
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+        return results
+
+    async def fetch_multiple_async(self, servers: List[Tuple[str, int]]) -> Dict[str, QueryResult]:
+        """
+        Async variant of fetch_multiple.
+
+        The whole batch is driven by the event loop from a single thread:
+        every query's send is dispatched before the first reply is awaited,
+        so wall time stays at roughly one timeout regardless of batch size
+        and no worker threads are tied up.
+
+        Args:
+            servers: List of (host, port) tuples
+
+        Returns:
+            Dictionary mapping "host:port" to QueryResult objects
+        """
+        results = await asyncio.gather(
+            *(self.fetch_async(host, port) for host, port in servers)
+        )
+        return {
+            f"{host}:{port}": result
+            for (host, port), result in zip(servers, results)
+        }
+
+    def fetch_multiple_fanout(self, servers: List[Tuple[str, int]]) -> Dict[str, QueryResult]:
+        """
+        Probe many servers over one UDP socket with a shared timeout window.
+
+        All hostnames are resolved up front (through the DNS cache), the
+        A2S_INFO request is sent to every address back-to-back on a single
+        non-blocking socket, and replies are demultiplexed by source address
+        as they arrive. One socket and one wait window replace a socket and
+        a full timeout per server, so an all-offline batch still costs only
+        one timeout. Results carry server info only - no player list.
+
+        Args:
+            servers: List of (host, port) tuples
+
+        Returns:
+            Dictionary mapping "host:port" to QueryResult objects
+        """
+        if not servers:
+            return {}
+
+        results: Dict[str, QueryResult] = {}
+        # Distinct inputs may resolve to the same address (hostname and
+        # literal for one server), so each address maps to every input key
+        # it serves and one reply answers them all
+        pending: Dict[Tuple[str, int], List[str]] = {}
         for host, port in servers:
             key = f"{host}:{port}"
-            results[key] = self.fetch(host, port)
+            error = self._validate_address(host, port)
+            if error is None:
+                resolved_ip, error = self._resolve_checked(host)
+            if error is not None:
+                logger.warning("Invalid input for %s:%s - %s", host, port, error)
+                results[key] = QueryResult(False, error=error)
+                continue
+            pending.setdefault((resolved_ip, port), []).append(key)
+        if not pending:
+            return results
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        try:
+            send_times = self._send_requests(sock, pending)
+            self._collect_responses(sock, pending, send_times, results)
+        except socket.error as e:
+            logger.warning("Fan-out socket error: %s", e)
+        finally:
+            sock.close()
+
+        for keys in pending.values():
+            for key in keys:
+                results[key] = QueryResult(False, error="Connection timeout - server may be offline")
         return results
 
+    @staticmethod
+    def _send_requests(sock: socket.socket,
+                       pending: Dict[Tuple[str, int], List[str]]) -> Dict[Tuple[str, int], float]:
+        """Fan the A2S_INFO probe out to every pending address.
+
+        Returns per-address send timestamps for ping measurement.
+        """
+        send_times: Dict[Tuple[str, int], float] = {}
+        for address in pending:
+            sock.sendto(_A2S_INFO_REQUEST, address)
+            send_times[address] = time.monotonic()
+        return send_times
+
+    def _collect_responses(self, sock: socket.socket,
+                           pending: Dict[Tuple[str, int], List[str]],
+                           send_times: Dict[Tuple[str, int], float],
+                           results: Dict[str, QueryResult]) -> None:
+        """
+        Demultiplex replies off the shared socket until the deadline.
+
+        Waits on a selector (epoll on Linux) so one syscall per wake covers
+        every outstanding server, parses each reply into results, and
+        removes answered addresses from pending; whatever remains when the
+        deadline passes is the caller's to mark as timed out.
+        """
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ)
+        try:
+            deadline = time.monotonic() + self.timeout
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    break
+                # Drain every datagram behind the readiness event before
+                # polling again
+                while True:
+                    try:
+                        data, address = sock.recvfrom(1400)
+                    except BlockingIOError:
+                        break
+                    keys = pending.get(address)
+                    if keys is None or len(data) < _INFO_HEADER.size:
+                        continue
+                    marker, response_type = _INFO_HEADER.unpack_from(data, 0)
+                    if marker != -1:
+                        # Stray or multi-packet datagram; CS 1.6 info
+                        # replies fit in a single packet
+                        continue
+                    if response_type == _A2S_CHALLENGE_RESPONSE:
+                        # Resend the probe with the challenge appended; the
+                        # real reply lands in a later iteration
+                        sock.sendto(_A2S_INFO_REQUEST + data[5:9], address)
+                        continue
+                    ping = (time.monotonic() - send_times[address]) * 1000
+                    result = self._parse_fanout_info(data, ping)
+                    for key in keys:
+                        results[key] = result
+                    del pending[address]
+        finally:
+            selector.close()
+
+    @staticmethod
+    def _parse_fanout_info(data: bytes, ping: float) -> QueryResult:
+        """Parse a raw A2S_INFO reply datagram into a QueryResult."""
+        try:
+            fields = _parse_info_fields(data)
+        except (ValueError, IndexError, struct.error) as e:
+            logger.debug("Malformed fan-out reply: %s", e)
+            return QueryResult(False, error=f"Malformed response: {str(e)}")
+        fields["ping"] = round(ping, 2)
+        fields["player_list"] = {"names": [], "scores": [], "durations": []}
+        return QueryResult(True, data=fields)
+
 
+@functools.lru_cache(maxsize=8)
 def create_fetcher(timeout: float = CS16ServerFetcher.DEFAULT_TIMEOUT) -> CS16ServerFetcher:
     """
-    Factory function to create a CS16ServerFetcher instance.
-    
+    Factory function returning a shared CS16ServerFetcher per timeout value.
+
+    The fetcher is stateless aside from its timeout, so instances are
+    cached and reused instead of being reallocated on every call.
+
     Args:
         timeout: Connection timeout in seconds
-        
+
     Returns:
         CS16ServerFetcher instance
     """
     return CS16ServerFetcher(timeout=timeout)
 
 
-def query_server(host: str, port: int, timeout: float = CS16ServerFetcher.DEFAULT_TIMEOUT) -> Dict[str, Any]:
+def query_server(host: str, port: int, timeout: float = CS16ServerFetcher.DEFAULT_TIMEOUT) -> QueryResult:
     """
     Convenience function to query a single server.
     
@@ -209,7 +856,6 @@ def query_server(host: str, port: int, timeout: float = CS16ServerFetcher.DEFAUL
         timeout: Connection timeout in seconds
         
     Returns:
-        Dictionary with server information (see CS16ServerFetcher.fetch for structure)
+        QueryResult with server information (see CS16ServerFetcher.fetch for structure)
     """
-    fetcher = create_fetcher(timeout=timeout)
-    return fetcher.fetch(host, port)
+    return create_fetcher(timeout=timeout).fetch(host, port)
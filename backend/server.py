@@ -1,5 +1,6 @@
-from fastapi import FastAPI, APIRouter, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi import FastAPI, APIRouter, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse, FileResponse
+from starlette.background import BackgroundTask
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -9,12 +10,25 @@ from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Any
 import uuid
+import time
+import hashlib
+from collections import defaultdict
 from datetime import datetime, timezone
 import asyncio
+import orjson
 import zipfile
-import io
+import tempfile
 import shutil
-from cs_server_fetcher import create_fetcher
+import socket
+from cs_server_fetcher import (
+    CS16ServerFetcher,
+    QueryResult,
+    is_ip_literal,
+    dns_cache_lookup,
+    dns_cache_store,
+    dns_cache_store_failure,
+    dns_cache_has_failure,
+)
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -24,8 +38,9 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
-# Create the main app without a prefix
-app = FastAPI()
+# Create the main app without a prefix; orjson serializes responses
+# several times faster than the stdlib json encoder
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -36,6 +51,9 @@ class ServerQueryRequest(BaseModel):
     ip: str
     port: int
 
+class ServerBatchQueryRequest(BaseModel):
+    servers: List[ServerQueryRequest]
+
 class ServerInfo(BaseModel):
     hostname: str
     map: str
@@ -97,18 +115,132 @@ class WidgetConfigCreate(BaseModel):
     layout: str = "default"
 
 
+# Shared fetcher instance - stateless aside from its timeout, so one is enough
+FETCHER = CS16ServerFetcher()
+
+
 # Helper function to query CS 1.6 server
-def query_cs_server(ip: str, port: int, timeout: float = 3.0) -> Dict[str, Any]:
+def query_cs_server(ip: str, port: int) -> QueryResult:
     """Query a CS 1.6 server using the A2S (Source Engine) protocol"""
-    fetcher = create_fetcher(timeout=timeout)
-    return fetcher.fetch(ip, port)
+    return FETCHER.fetch(ip, port)
+
+
+# In-flight query map: concurrent identical queries await one shared future
+# instead of each firing their own A2S round trip (singleflight pattern)
+_inflight_queries: Dict[tuple, asyncio.Future] = {}
+
+
+async def query_cs_server_async(ip: str, port: int) -> QueryResult:
+    """Query a CS 1.6 server on the event loop using a2s's native async API"""
+    key = (ip, port)
+    inflight = _inflight_queries.get(key)
+    if inflight is not None:
+        # Shield so a cancelled waiter doesn't cancel the shared query
+        return await asyncio.shield(inflight)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight_queries[key] = future
+    try:
+        result = await FETCHER.fetch_async(ip, port)
+        future.set_result(result)
+        return result
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        _inflight_queries.pop(key, None)
+
+
+async def resolve_host_async(host: str) -> str:
+    """
+    Resolve a hostname on the event loop so worker threads never block on DNS.
+
+    IP literals and cached hostnames are returned without touching the
+    resolver; unresolvable hosts are returned unchanged so the fetcher
+    reports the resolution error through its normal error path. Failures
+    are negatively cached, so the fetcher's own resolve fails fast
+    instead of repeating the lookup - synchronously, on this thread.
+    """
+    if is_ip_literal(host):
+        return host
+
+    cached = dns_cache_lookup(host)
+    if cached is not None:
+        return cached
+
+    if dns_cache_has_failure(host):
+        return host
+
+    loop = asyncio.get_running_loop()
+    try:
+        infos = await loop.getaddrinfo(host, None, type=socket.SOCK_DGRAM)
+    except socket.gaierror:
+        dns_cache_store_failure(host)
+        return host
+
+    resolved_ip = infos[0][4][0]
+    dns_cache_store(host, resolved_ip)
+    return resolved_ip
+
+
+# Bound concurrent A2S queries so a large batch can't exhaust threads or sockets
+QUERY_SEMAPHORE = asyncio.Semaphore(64)
+
+# In-process cache for widget configs: config_id -> (expiry, config doc).
+# Configs are effectively immutable after creation, so a generous TTL saves
+# one MongoDB round trip per status poll and widget load.
+CONFIG_CACHE_TTL = 120.0
+_config_cache: Dict[str, tuple] = {}
+
+
+async def load_config(config_id: str) -> Optional[Dict[str, Any]]:
+    """Load a widget configuration, serving repeat lookups from memory"""
+    cached = _config_cache.get(config_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    projection = {"_id": 0, "widget_html": 0}
+    config = await db.widget_configs.find_one({"_id": config_id}, projection)
+    if config is None:
+        # Fall back for documents saved before configs were keyed by _id
+        config = await db.widget_configs.find_one({"config_id": config_id}, projection)
+    if config is not None:
+        _config_cache[config_id] = (time.monotonic() + CONFIG_CACHE_TTL, config)
+    return config
+
+
+# Short-TTL cache for widget status responses: config_id -> (expiry, payload,
+# etag). N open tabs polling the same widget collapse into one A2S query per
+# window.
+_status_cache: Dict[str, tuple] = {}
+_status_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Shorter than any refresh interval, so browsers and intermediaries can
+# absorb polls without serving stale data for long
+STATUS_CACHE_CONTROL = "public, max-age=5"
+
+
+def _status_response(payload: Dict[str, Any], etag: str, request: Request) -> Response:
+    """Serve a status payload with cache headers, honoring If-None-Match"""
+    headers = {"ETag": etag, "Cache-Control": STATUS_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
+
+async def query_cs_server_bounded(ip: str, port: int) -> QueryResult:
+    """Run a server query on the event loop, bounded by the global semaphore"""
+    ip = await resolve_host_async(ip)
+    async with QUERY_SEMAPHORE:
+        return await query_cs_server_async(ip, port)
 
 
 # API Routes
 @api_router.post("/query-server")
 async def query_server(request: ServerQueryRequest):
     """Query a CS 1.6 server and return its information"""
-    result = await asyncio.to_thread(query_cs_server, request.ip, request.port)
+    ip = await resolve_host_async(request.ip)
+    result = await query_cs_server_async(ip, request.port)
     
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["error"])
@@ -116,28 +248,53 @@ async def query_server(request: ServerQueryRequest):
     return result["data"]
 
 
+@api_router.post("/query-servers")
+async def query_servers(request: ServerBatchQueryRequest):
+    """Query multiple CS 1.6 servers concurrently and return all results"""
+    results = await asyncio.gather(
+        *(query_cs_server_bounded(server.ip, server.port) for server in request.servers)
+    )
+
+    return {
+        # Results are QueryResult slot objects; the JSON edge needs dicts
+        f"{server.ip}:{server.port}": result.as_dict()
+        for server, result in zip(request.servers, results)
+    }
+
+
 @api_router.post("/save-config", response_model=WidgetConfig)
 async def save_config(config: WidgetConfigCreate):
     """Save widget configuration to database"""
     config_obj = WidgetConfig(**config.model_dump())
     
-    # Convert to dict and serialize datetime
+    # created_at stays a datetime - PyMongo encodes it as a native BSON
+    # Date, so there is no string round trip on either side
     doc = config_obj.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
-    
+
+    # Key the document by config_id so lookups hit the mandatory _id index
+    # instead of scanning the collection (the config_id field is kept so
+    # read projections stay unchanged)
+    doc['_id'] = config_obj.config_id
+
+    # The widget markup only depends on the config, so render it once now
+    # and store it; serve_widget then ships the stored bytes verbatim
+    doc['widget_html'] = render_widget_html(config_obj.config_id, doc)
+
     await db.widget_configs.insert_one(doc)
+    _config_cache.pop(config_obj.config_id, None)
+    _widget_html_cache.pop(config_obj.config_id, None)
     return config_obj
 
 
 @api_router.get("/config/{config_id}")
 async def get_config(config_id: str):
     """Retrieve a saved widget configuration"""
-    config = await db.widget_configs.find_one({"config_id": config_id}, {"_id": 0})
-    
+    config = await load_config(config_id)
+
     if not config:
         raise HTTPException(status_code=404, detail="Configuration not found")
     
-    # Convert ISO string timestamp back to datetime
+    # Documents written before the BSON Date change stored an ISO string
     if isinstance(config['created_at'], str):
         config['created_at'] = datetime.fromisoformat(config['created_at'])
     
@@ -145,52 +302,64 @@ async def get_config(config_id: str):
 
 
 @api_router.get("/server-status/{config_id}")
-async def get_server_status(config_id: str):
+async def get_server_status(config_id: str, request: Request):
     """Get real-time server status for a saved configuration"""
-    config = await db.widget_configs.find_one({"config_id": config_id}, {"_id": 0})
-    
+    config = await load_config(config_id)
+
     if not config:
         raise HTTPException(status_code=404, detail="Configuration not found")
-    
-    result = await asyncio.to_thread(
-        query_cs_server, 
-        config["server_ip"], 
-        config["server_port"]
-    )
-    
-    if not result["success"]:
-        return {"success": False, "error": result["error"]}
-    
-    # Filter data based on enabled fields
-    filtered_data = {}
-    for field, enabled in config["enabled_fields"].items():
-        if enabled and field in result["data"]:
-            filtered_data[field] = result["data"][field]
-    
-    return {
-        "success": True,
-        "data": filtered_data,
-        "config": {
-            "theme": config["theme"],
-            "accent_color": config["accent_color"],
-            "font_family": config["font_family"],
-            "dark_mode": config["dark_mode"],
-            "refresh_interval": config["refresh_interval"]
-        }
-    }
 
+    ttl = max(5, config["refresh_interval"] // 2)
+
+    cached = _status_cache.get(config_id)
+    if cached and cached[0] > time.monotonic():
+        return _status_response(cached[1], cached[2], request)
+
+    async with _status_locks[config_id]:
+        # Re-check under the lock so concurrent pollers coalesce into one query
+        cached = _status_cache.get(config_id)
+        if cached and cached[0] > time.monotonic():
+            return _status_response(cached[1], cached[2], request)
+
+        server_ip = await resolve_host_async(config["server_ip"])
+        result = await query_cs_server_async(server_ip, config["server_port"])
+
+        if not result["success"]:
+            response = {"success": False, "error": result["error"]}
+        else:
+            # Filter data based on enabled fields
+            filtered_data = {}
+            for field, enabled in config["enabled_fields"].items():
+                if enabled and field in result["data"]:
+                    filtered_data[field] = result["data"][field]
+
+            response = {
+                "success": True,
+                "data": filtered_data,
+                "config": {
+                    "theme": config["theme"],
+                    "accent_color": config["accent_color"],
+                    "font_family": config["font_family"],
+                    "dark_mode": config["dark_mode"],
+                    "refresh_interval": config["refresh_interval"]
+                }
+            }
 
-@api_router.get("/widget/{config_id}", response_class=HTMLResponse)
-async def serve_widget(config_id: str):
-    """Serve the live widget HTML for iframe embedding"""
-    config = await db.widget_configs.find_one({"config_id": config_id}, {"_id": 0})
-    
-    if not config:
-        return HTMLResponse("<div style='color:red;padding:20px;'>Widget configuration not found</div>", status_code=404)
-    
+        etag = hashlib.blake2b(orjson.dumps(response)).hexdigest()[:16]
+        _status_cache[config_id] = (time.monotonic() + ttl, response, etag)
+        return _status_response(response, etag, request)
+
+
+# Rendered widget cache: config_id -> (html, etag). The markup only depends
+# on the stored config, so re-interpolating it per iframe load is wasted work.
+_widget_html_cache: Dict[str, tuple] = {}
+
+
+def render_widget_html(config_id: str, config: Dict[str, Any]) -> str:
+    """Render the standalone widget HTML for a saved configuration"""
     # Get the backend URL from environment
     backend_url = os.environ.get('BACKEND_URL', 'http://localhost:8001')
-    
+
     html = f"""
 <!DOCTYPE html>
 <html lang="en">
@@ -369,20 +538,21 @@ async def serve_widget(config_id: str):
                     `;
                 }}
                 
-                if (data.player_list && data.player_list.length > 0) {{
+                if (data.player_list && data.player_list.names && data.player_list.names.length > 0) {{
+                    const players = data.player_list;
                     html += `
                         <div class="info-item" style="flex-direction: column; align-items: flex-start;">
                             <span class="info-label">Active Players</span>
                             <div class="player-list">
                     `;
-                    data.player_list.forEach(player => {{
-                        const duration = Math.floor(player.duration / 60);
+                    for (let i = 0; i < players.names.length; i++) {{
+                        const duration = Math.floor(players.durations[i] / 60);
                         html += `
                             <div class="player">
-                                ${{player.name}} - Score: ${{player.score}} - Time: ${{duration}}m
+                                ${{players.names[i]}} - Score: ${{players.scores[i]}} - Time: ${{duration}}m
                             </div>
                         `;
-                    }});
+                    }}
                     html += '</div></div>';
                 }}
                 
@@ -405,50 +575,73 @@ async def serve_widget(config_id: str):
 </body>
 </html>
     """
-    
-    return HTMLResponse(content=html)
 
+    return html
 
-@api_router.get("/download-project")
-async def download_project():
-    """Create and download a ZIP file of the project"""
-    try:
-        # Create a BytesIO object to store the zip file in memory
-        zip_buffer = io.BytesIO()
+
+@api_router.get("/widget/{config_id}", response_class=HTMLResponse)
+async def serve_widget(config_id: str, request: Request):
+    """Serve the live widget HTML for iframe embedding"""
+    cached = _widget_html_cache.get(config_id)
+    if cached is None:
+        projection = {"widget_html": 1}
+        doc = await db.widget_configs.find_one({"_id": config_id}, projection)
+        if doc is None:
+            doc = await db.widget_configs.find_one({"config_id": config_id}, projection)
+        if doc is None:
+            return HTMLResponse("<div style='color:red;padding:20px;'>Widget configuration not found</div>", status_code=404)
+
+        html = doc.get("widget_html")
+        if html is None:
+            # Configs saved before the HTML was materialized at save time
+            config = await load_config(config_id)
+            html = render_widget_html(config_id, config)
+
+        etag = hashlib.blake2b(html.encode()).hexdigest()[:16]
+        cached = (html, etag)
+        _widget_html_cache[config_id] = cached
+
+    html, etag = cached
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    return HTMLResponse(content=html, headers={"ETag": etag})
+
+
+def _build_project_zip(zip_path: str) -> None:
+    """Write the project ZIP to zip_path (blocking; run in a worker thread)"""
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        # Define the project root
+        project_root = Path('/app')
+        
+        # Files to include
+        files_to_include = [
+            'backend/server.py',
+            'backend/requirements.txt',
+            'backend/.env.example',
+            'frontend/src/App.js',
+            'frontend/src/App.css',
+            'frontend/src/index.js',
+            'frontend/src/pages/HomePage.js',
+            'frontend/src/pages/SettingsPage.js',
+            'frontend/src/pages/PreviewPage.js',
+            'frontend/src/pages/SecretDownloadPage.js',
+            'frontend/src/components/WidgetPreview.js',
+            'frontend/package.json',
+            'frontend/tailwind.config.js',
+            'frontend/postcss.config.js',
+            'frontend/.env.example'
+        ]
         
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # Define the project root
-            project_root = Path('/app')
-            
-            # Files to include
-            files_to_include = [
-                'backend/server.py',
-                'backend/requirements.txt',
-                'backend/.env.example',
-                'frontend/src/App.js',
-                'frontend/src/App.css',
-                'frontend/src/index.js',
-                'frontend/src/pages/HomePage.js',
-                'frontend/src/pages/SettingsPage.js',
-                'frontend/src/pages/PreviewPage.js',
-                'frontend/src/pages/SecretDownloadPage.js',
-                'frontend/src/components/WidgetPreview.js',
-                'frontend/package.json',
-                'frontend/tailwind.config.js',
-                'frontend/postcss.config.js',
-                'frontend/.env.example'
-            ]
-            
-            # Add files to ZIP
-            for file_path in files_to_include:
-                full_path = project_root / file_path
-                if full_path.exists():
-                    # Add file to zip with its relative path
-                    zip_file.write(full_path, f'cs-server-embed-generator/{file_path}')
-            
-            # Create README.md
-            readme_content = """# CS Server Embed Generator
+        # Add files to ZIP
+        for file_path in files_to_include:
+            full_path = project_root / file_path
+            if full_path.exists():
+                # Add file to zip with its relative path
+                zip_file.write(full_path, f'cs-server-embed-generator/{file_path}')
+        
+        # Create README.md
+        readme_content = """# CS Server Embed Generator
 
 A full-stack application for generating customizable, real-time HTML embed widgets for Counter-Strike 1.6 servers.
 
@@ -544,37 +737,43 @@ Open Source - MIT License
 
 Built with ❤️ using FastAPI and React
 """
-            
-            # Add README to ZIP
-            zip_file.writestr('cs-server-embed-generator/README.md', readme_content)
-            
-            # Create .env.example files
-            backend_env_example = """MONGO_URL=mongodb://localhost:27017
+        
+        # Add README to ZIP
+        zip_file.writestr('cs-server-embed-generator/README.md', readme_content)
+        
+        # Create .env.example files
+        backend_env_example = """MONGO_URL=mongodb://localhost:27017
 DB_NAME=cs_server_db
 CORS_ORIGINS=*
 BACKEND_URL=http://localhost:8001
 """
-            zip_file.writestr('cs-server-embed-generator/backend/.env.example', backend_env_example)
-            
-            frontend_env_example = """REACT_APP_BACKEND_URL=http://localhost:8001
+        zip_file.writestr('cs-server-embed-generator/backend/.env.example', backend_env_example)
+        
+        frontend_env_example = """REACT_APP_BACKEND_URL=http://localhost:8001
 WDS_SOCKET_PORT=443
 REACT_APP_ENABLE_VISUAL_EDITS=false
 ENABLE_HEALTH_CHECK=false
 """
-            zip_file.writestr('cs-server-embed-generator/frontend/.env.example', frontend_env_example)
-        
-        # Seek to the beginning of the BytesIO object
-        zip_buffer.seek(0)
-        
-        # Return the ZIP file as a streaming response
-        return StreamingResponse(
-            zip_buffer,
+        zip_file.writestr('cs-server-embed-generator/frontend/.env.example', frontend_env_example)
+
+
+@api_router.get("/download-project")
+async def download_project():
+    """Create and download a ZIP file of the project"""
+    try:
+        # Build the archive in a temp file off the event loop, then stream
+        # it from disk; the temp file is removed once the response is sent
+        tmp = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
+        tmp.close()
+        await asyncio.to_thread(_build_project_zip, tmp.name)
+
+        return FileResponse(
+            tmp.name,
             media_type="application/zip",
-            headers={
-                "Content-Disposition": f"attachment; filename=cs-server-embed-generator-{int(time.time())}.zip"
-            }
+            filename=f"cs-server-embed-generator-{int(time.time())}.zip",
+            background=BackgroundTask(os.unlink, tmp.name)
         )
-    
+
     except Exception as e:
         logger.error(f"Error creating project download: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to create project download")
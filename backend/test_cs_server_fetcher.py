@@ -1,164 +1,286 @@
-#!/usr/bin/env python3
 """
-Test script for the CS 1.6 Server Status Fetcher module.
+Tests for the CS 1.6 Server Status Fetcher module.
 
-This script tests the module with various scenarios including:
-- Valid server queries
-- Invalid addresses
-- Timeout handling
-- Hostname resolution
+Covers address validation, error responses for unresolvable and
+unreachable servers, fetcher construction, and batch fetching. DNS and
+socket reads are mocked so the suite runs in milliseconds without any
+network access; the real network path is covered by an opt-in
+integration test (RUN_INTEGRATION=1).
 """
 
-import sys
-from cs_server_fetcher import (
-    CS16ServerFetcher,
-    create_fetcher,
-    query_server
-)
+import os
+import socket
+import struct
+import threading
+from unittest.mock import MagicMock
 
+import pytest
+
+# cs_server_fetcher is imported inside each test rather than at module
+# top, so collection stays cheap and validation-only tests never pay for
+# it; sys.modules makes every import after the first free.
+
+
+@pytest.fixture(scope="session")
+def shared_fetcher():
+    """One fetcher shared by every test that isn't testing construction."""
+    from cs_server_fetcher import CS16ServerFetcher
+
+    fetcher = CS16ServerFetcher(timeout=1.0)
+    yield fetcher
+    fetcher.close()
 
-def test_address_validation():
-    """Test address validation"""
-    print("\n=== Testing Address Validation ===")
-    fetcher = CS16ServerFetcher()
-    
-    # Test invalid port (too high)
-    try:
-        fetcher.resolve_address("192.168.1.100", 70000)
-        print("❌ Should have raised ValueError for port > 65535")
-    except ValueError as e:
-        print(f"✓ Correctly rejected invalid port: {e}")
-    
-    # Test invalid port (too low)
-    try:
-        fetcher.resolve_address("192.168.1.100", 0)
-        print("❌ Should have raised ValueError for port < 1")
-    except ValueError as e:
-        print(f"✓ Correctly rejected invalid port: {e}")
-    
-    # Test invalid port type
-    try:
-        fetcher.resolve_address("192.168.1.100", "27015")
-        print("❌ Should have raised ValueError for non-integer port")
-    except ValueError as e:
-        print(f"✓ Correctly rejected non-integer port: {e}")
-    
-    # Test empty hostname
-    try:
-        fetcher.resolve_address("", 27015)
-        print("❌ Should have raised ValueError for empty hostname")
-    except ValueError as e:
-        print(f"✓ Correctly rejected empty hostname: {e}")
 
+@pytest.fixture
+def failing_dns(monkeypatch):
+    """Make every hostname lookup fail immediately, without real DNS."""
+    def fail_resolution(*args, **kwargs):
+        raise socket.gaierror("mocked resolver failure")
+    monkeypatch.setattr("cs_server_fetcher.socket.getaddrinfo", fail_resolution)
+
+
+@pytest.fixture
+def timeout_socket(monkeypatch):
+    """Make every UDP socket read time out immediately, without real I/O."""
+    def make_socket(*args, **kwargs):
+        mock_sock = MagicMock()
+        mock_sock.recv.side_effect = socket.timeout("mocked timeout")
+        mock_sock.recvfrom.side_effect = socket.timeout("mocked timeout")
+        return mock_sock
+    monkeypatch.setattr("cs_server_fetcher.socket.socket", make_socket)
+
+
+@pytest.mark.parametrize("host,port", [
+    ("192.168.1.100", 70000),   # port too high
+    ("192.168.1.100", 0),       # port too low
+    ("192.168.1.100", "27015"), # non-integer port
+    ("", 27015),                # empty hostname
+])
+def test_address_validation(shared_fetcher, host, port):
+    """resolve_address rejects invalid input with ValueError."""
+    with pytest.raises(ValueError):
+        shared_fetcher.resolve_address(host, port)
+
+
+def test_invalid_address(failing_dns):
+    """Querying a non-existent hostname fails cleanly."""
+    from cs_server_fetcher import query_server
 
-def test_invalid_address():
-    """Test querying invalid address"""
-    print("\n=== Testing Invalid Address ===")
     result = query_server("invalid-host-that-definitely-does-not-exist-12345.com", 27015)
-    
-    if not result["success"]:
-        print(f"✓ Correctly failed with error: {result['error']}")
-    else:
-        print("❌ Should have failed for non-existent hostname")
+    assert result["success"] is False, result
+    assert "resolve" in result["error"].lower()
+
 
+def test_invalid_server(timeout_socket):
+    """Querying an unreachable server times out with an error result."""
+    from cs_server_fetcher import query_server
 
-def test_invalid_server():
-    """Test querying unreachable server"""
-    print("\n=== Testing Unreachable Server ===")
-    # Use a non-routable address that will timeout
     result = query_server("192.0.2.1", 27015, timeout=1.0)
-    
-    if not result["success"]:
-        print(f"✓ Correctly failed with error: {result['error']}")
-    else:
-        print("❌ Should have failed for unreachable server")
+    assert result["success"] is False, result
+    assert "timeout" in result["error"].lower()
 
 
 def test_fetcher_creation():
-    """Test fetcher creation methods"""
-    print("\n=== Testing Fetcher Creation ===")
-    
-    # Test create_fetcher
+    """Fetchers are constructible via the factory and the class."""
+    from cs_server_fetcher import CS16ServerFetcher, create_fetcher
+
     fetcher1 = create_fetcher(timeout=2.0)
-    print(f"✓ Created fetcher with create_fetcher(): {type(fetcher1).__name__}")
-    
-    # Test class instantiation
+    assert isinstance(fetcher1, CS16ServerFetcher)
+    assert fetcher1.timeout == 2.0
+
     fetcher2 = CS16ServerFetcher(timeout=3.0)
-    print(f"✓ Created fetcher with class: {type(fetcher2).__name__}")
-    
-    # Test default timeout
+    assert fetcher2.timeout == 3.0
+
     fetcher3 = CS16ServerFetcher()
-    print(f"✓ Created fetcher with default timeout: {fetcher3.timeout}s")
+    assert fetcher3.timeout == CS16ServerFetcher.DEFAULT_TIMEOUT
+
 
+def test_response_format(failing_dns):
+    """Error responses carry the success flag and an error message."""
+    from cs_server_fetcher import query_server
 
-def test_response_format():
-    """Test response format for error case"""
-    print("\n=== Testing Response Format ===")
-    
     result = query_server("invalid.server.test", 27015, timeout=1.0)
-    
-    # Check response structure
-    if "success" not in result:
-        print("❌ Missing 'success' field in response")
-        return
-    
-    if not result["success"] and "error" not in result:
-        print("❌ Missing 'error' field in error response")
-        return
-    
-    print(f"✓ Response structure is correct")
-    print(f"  - success: {result['success']}")
-    print(f"  - error: {result.get('error', 'N/A')}")
-
-
-def test_multiple_servers():
-    """Test multiple server fetching"""
-    print("\n=== Testing Multiple Server Fetching ===")
-    
-    fetcher = create_fetcher(timeout=1.0)
-    
+    assert "success" in result
+    assert result["success"] is False
+    assert "error" in result
+    assert isinstance(result["error"], str) and result["error"]
+
+
+def test_multiple_servers(shared_fetcher, failing_dns):
+    """fetch_multiple returns one keyed result per requested server."""
     servers = [
         ("invalid1.test", 27015),
         ("invalid2.test", 27015),
         ("invalid3.test", 27015),
     ]
-    
-    results = fetcher.fetch_multiple(servers)
-    
-    if len(results) == 3:
-        print(f"✓ Fetched {len(results)} servers")
-        for key, result in results.items():
-            status = "success" if result["success"] else "failed"
-            print(f"  - {key}: {status}")
-    else:
-        print(f"❌ Expected 3 results, got {len(results)}")
-
-
-def main():
-    """Run all tests"""
-    print("=" * 60)
-    print("CS 1.6 Server Status Fetcher - Test Suite")
-    print("=" * 60)
-    
+
+    results = shared_fetcher.fetch_multiple(servers)
+
+    assert len(results) == 3
+    for host, port in servers:
+        result = results[f"{host}:{port}"]
+        assert result["success"] is False, result
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not os.environ.get("RUN_INTEGRATION"),
+                    reason="set RUN_INTEGRATION=1 to hit the real network")
+def test_unreachable_server_integration():
+    """Real UDP timeout against a non-routable TEST-NET-1 address."""
+    from cs_server_fetcher import query_server
+
+    result = query_server("192.0.2.1", 27015, timeout=1.0)
+    assert result["success"] is False, result
+
+
+def _cstr(text):
+    return text.encode("utf-8") + b"\0"
+
+
+def _source_info_packet():
+    """Craft a single-packet Source-layout (0x49) A2S_INFO reply."""
+    return (
+        b"\xff\xff\xff\xff\x49\x30"  # simple header, type 'I', protocol 48
+        + _cstr("Fake Server") + _cstr("de_dust2")
+        + _cstr("cstrike") + _cstr("Counter-Strike")
+        # app_id, players, max, bots, server type, platform, password, vac
+        + struct.pack("<HBBBccBB", 10, 5, 32, 0, b"d", b"l", 0, 1)
+        + _cstr("1.1.2.7") + b"\x00"
+    )
+
+
+def _goldsrc_info_packet(is_mod):
+    """Craft a GoldSrc-layout (0x6D) A2S_INFO reply."""
+    packet = (
+        b"\xff\xff\xff\xff\x6d"
+        + _cstr("1.2.3.4:27015") + _cstr("Old Server") + _cstr("cs_assault")
+        + _cstr("cstrike") + _cstr("Counter-Strike")
+        # players, max, protocol, server type, platform, password, is_mod
+        + struct.pack("<BBBccBB", 7, 20, 47, b"d", b"w", 1, 1 if is_mod else 0)
+    )
+    if is_mod:
+        packet += (_cstr("www.counter-strike.net") + _cstr("")
+                   + b"\x00" + struct.pack("<II", 1, 184000) + b"\x01\x00")
+    return packet + b"\x01\x00"  # vac enabled, no bots
+
+
+def test_parse_source_info():
+    """The Source (0x49) reply layout decodes field for field."""
+    from cs_server_fetcher import _parse_info_fields
+
+    fields = _parse_info_fields(_source_info_packet())
+    assert fields == {
+        "hostname": "Fake Server",
+        "map": "de_dust2",
+        "current_players": 5,
+        "max_players": 32,
+        "game": "Counter-Strike",
+        "server_type": "d",
+        "os": "l",
+        "password_protected": False,
+        "vac_enabled": True,
+    }
+
+
+@pytest.mark.parametrize("is_mod", [True, False])
+def test_parse_goldsrc_info(is_mod):
+    """The GoldSrc (0x6D) layout decodes with and without the mod section."""
+    from cs_server_fetcher import _parse_info_fields
+
+    fields = _parse_info_fields(_goldsrc_info_packet(is_mod))
+    assert fields["hostname"] == "Old Server"
+    assert fields["map"] == "cs_assault"
+    assert fields["current_players"] == 7
+    assert fields["max_players"] == 20
+    assert fields["password_protected"] is True
+    assert fields["vac_enabled"] is True
+
+
+def test_parse_info_rejects_unknown_type():
+    """Replies with an unknown response type raise ValueError."""
+    from cs_server_fetcher import _parse_info_fields
+
+    with pytest.raises(ValueError):
+        _parse_info_fields(b"\xff\xff\xff\xff\x99rest")
+
+
+def test_parse_fanout_info_handles_truncated_reply():
+    """Truncated datagrams become error results, not exceptions."""
+    from cs_server_fetcher import CS16ServerFetcher
+
+    result = CS16ServerFetcher._parse_fanout_info(b"\xff\xff\xff\xff\x49\x30abc", 1.0)
+    assert result["success"] is False
+    assert "malformed" in result["error"].lower()
+
+
+@pytest.fixture
+def fake_a2s_server():
+    """Loopback UDP responder: answers the first probe with a challenge,
+    then a challenged probe with a crafted Source info reply."""
+    server_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server_sock.bind(("127.0.0.1", 0))
+    server_sock.settimeout(5.0)
+    challenge = b"\x01\x02\x03\x04"
+
+    def respond():
+        while True:
+            try:
+                data, addr = server_sock.recvfrom(1400)
+            except (socket.timeout, OSError):
+                return
+            if data.endswith(challenge):
+                server_sock.sendto(_source_info_packet(), addr)
+            else:
+                server_sock.sendto(b"\xff\xff\xff\xff\x41" + challenge, addr)
+
+    thread = threading.Thread(target=respond, daemon=True)
+    thread.start()
+    yield server_sock.getsockname()[1]
+    server_sock.close()
+
+
+def test_fetch_multiple_fanout(fake_a2s_server):
+    """The fan-out answers live servers (via the challenge round trip)
+    and fills in timeouts for silent ones within one shared window."""
+    from cs_server_fetcher import CS16ServerFetcher
+
+    silent = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    silent.bind(("127.0.0.1", 0))
+    silent_port = silent.getsockname()[1]
+    fetcher = CS16ServerFetcher(timeout=0.5)
     try:
-        test_fetcher_creation()
-        test_address_validation()
-        test_response_format()
-        test_invalid_address()
-        test_invalid_server()
-        test_multiple_servers()
-        
-        print("\n" + "=" * 60)
-        print("✓ All tests completed successfully!")
-        print("=" * 60)
-        return 0
-        
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-
-if __name__ == "__main__":
-    sys.exit(main())
+        results = fetcher.fetch_multiple_fanout([
+            ("127.0.0.1", fake_a2s_server),
+            ("127.0.0.1", silent_port),
+            ("", 27015),
+        ])
+    finally:
+        silent.close()
+        fetcher.close()
+
+    assert len(results) == 3
+    live = results[f"127.0.0.1:{fake_a2s_server}"]
+    assert live["success"] is True, live
+    assert live["data"]["hostname"] == "Fake Server"
+    assert live["data"]["player_list"] == {"names": [], "scores": [], "durations": []}
+    assert results[f"127.0.0.1:{silent_port}"]["success"] is False
+    assert results[":27015"]["success"] is False
+
+
+def test_fetch_multiple_fanout_duplicate_addresses(fake_a2s_server):
+    """Inputs that resolve to the same address each keep their own result."""
+    from cs_server_fetcher import CS16ServerFetcher
+
+    fetcher = CS16ServerFetcher(timeout=1.0)
+    try:
+        # "127.1" resolves to 127.0.0.1, colliding with the literal input
+        results = fetcher.fetch_multiple_fanout([
+            ("127.1", fake_a2s_server),
+            ("127.0.0.1", fake_a2s_server),
+        ])
+    finally:
+        fetcher.close()
+
+    assert len(results) == 2
+    for key in (f"127.1:{fake_a2s_server}", f"127.0.0.1:{fake_a2s_server}"):
+        assert results[key]["success"] is True, results[key]
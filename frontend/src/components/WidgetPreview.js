@@ -144,11 +144,11 @@ const WidgetPreview = ({
           </div>
         )}
         
-        {enabledFields.player_list && serverData.player_list && serverData.player_list.length > 0 && (
+        {enabledFields.player_list && serverData.player_list && serverData.player_list.names && serverData.player_list.names.length > 0 && (
           <div style={{ ...getItemStyles(), flexDirection: "column", alignItems: "flex-start" }}>
             <span style={{ ...getLabelStyles(), marginBottom: "8px" }}>Active Players</span>
             <div style={{ width: "100%" }}>
-              {serverData.player_list.map((player, idx) => (
+              {serverData.player_list.names.map((name, idx) => (
                 <div
                   key={idx}
                   style={{
@@ -160,7 +160,7 @@ const WidgetPreview = ({
                     transition: `all ${getAnimationDuration()} ease`
                   }}
                 >
-                  {player.name} - Score: {player.score} - Time: {Math.floor(player.duration / 60)}m
+                  {name} - Score: {serverData.player_list.scores[idx]} - Time: {Math.floor(serverData.player_list.durations[idx] / 60)}m
                 </div>
               ))}
             </div>